@@ -11,6 +11,28 @@ from nrel.routee.compass.io.utils import add_grade_to_graph
 log = logging.getLogger(__name__)
 
 
+def _largest_component(g):
+    """
+    Returns a copy of the largest weakly connected component of the graph.
+
+    Matches osmnx.truncate.largest_component but labels the components with
+    scipy's compiled csgraph routine rather than a pure-Python traversal of
+    the NetworkX graph.
+    """
+    try:
+        import networkx as nx
+        import numpy as np
+        from scipy.sparse.csgraph import connected_components
+    except ImportError:
+        raise ImportError("requires scipy to be installed. Try 'pip install scipy'")
+
+    adjacency = nx.to_scipy_sparse_array(g, format="csr")
+    _, labels = connected_components(adjacency, connection="weak")
+    largest = np.bincount(labels).argmax()
+    keep = {n for n, label in zip(g.nodes, labels) if label == largest}
+    return g.subgraph(keep).copy()
+
+
 def generate_compass_dataset(
     g,
     output_directory: Union[str, Path],
@@ -74,7 +96,7 @@ def generate_compass_dataset(
 
     # pre-process the graph
     print("processing graph topology and speeds")
-    g1 = ox.truncate.largest_component(g)
+    g1 = _largest_component(g)
     g1 = ox.add_edge_speeds(g1, hwy_speeds=hwy_speeds, fallback=fallback, agg=agg)
     g1 = ox.add_edge_bearings(g1)
 
@@ -93,10 +115,7 @@ def generate_compass_dataset(
 
     # process edges
     print("processing edges")
-    lookup = v.set_index("vertex_uuid")
-
-    def replace_id(vertex_uuid):
-        return lookup.loc[vertex_uuid].vertex_id
+    lookup = v.set_index("vertex_uuid").vertex_id
 
     e = e.reset_index(drop=False).rename(
         columns={
@@ -108,8 +127,8 @@ def generate_compass_dataset(
     )
     e = e[e["key"] == 0]  # take the first entry regardless of what it is (is this ok?)
     e["edge_id"] = range(len(e))
-    e["src_vertex_id"] = e.src_vertex_uuid.apply(replace_id)
-    e["dst_vertex_id"] = e.dst_vertex_uuid.apply(replace_id)
+    e["src_vertex_id"] = e.src_vertex_uuid.map(lookup)
+    e["dst_vertex_id"] = e.dst_vertex_uuid.map(lookup)
 
     # WRITE NETWORK FILES
     output_directory.mkdir(parents=True, exist_ok=True)
@@ -154,7 +173,7 @@ def generate_compass_dataset(
         header=False,
     )
 
-    headings = e.bearing.fillna(0).apply(lambda x: int(round(x)))
+    headings = e.bearing.fillna(0).round().astype(int)
     headings_df = headings.to_frame(name="arrival_heading")
 
     # We could get more sophisticated and compute the end heading
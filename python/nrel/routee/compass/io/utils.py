@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from functools import partial
 from pathlib import Path
 
 import math
-import itertools
 import logging
+import os
+import shutil
 from typing import Union, Optional
 
 log = logging.getLogger(__name__)
@@ -38,29 +41,36 @@ class TileResolution(Enum):
             )
 
 
-def _cover_floats_with_integers(float_min: float, float_max: float) -> list[int]:
-    if float_max < float_min:
-        raise ValueError("float max must be greater than float min")
+def _tiles_covering_bounds(
+    min_lat: float, max_lat: float, min_lon: float, max_lon: float
+) -> list[str]:
+    """
+    Builds the names of the USGS tiles (e.g. n39w105) covering a bounding box
+    in one vectorized pass rather than one Python call per integer lat/lon pair.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("requires numpy to be installed. Try 'pip install numpy'")
 
-    start = math.floor(float_min)
-    end = math.ceil(float_max)
+    if max_lat < min_lat or max_lon < min_lon:
+        raise ValueError("bounds max must be greater than bounds min")
 
-    integers = list(range(start, end + 1))
-    return integers
+    lats = np.arange(math.floor(min_lat), math.ceil(max_lat) + 1)
+    lons = np.arange(math.floor(min_lon), math.ceil(max_lon) + 1)
+    lat_grid, lon_grid = np.meshgrid(lats, lons, indexing="ij")
+    lat_grid = lat_grid.ravel()
+    lon_grid = lon_grid.ravel()
 
+    lat_prefix = np.where(lat_grid < 0, "s", "n")
+    lon_prefix = np.where(lon_grid < 0, "w", "e")
+    lat_digits = np.char.zfill(np.abs(lat_grid).astype(str), 2)
+    lon_digits = np.char.zfill(np.abs(lon_grid).astype(str), 3)
 
-def _lat_lon_to_tile(coord: tuple[int, int]) -> str:
-    lat, lon = coord
-    if lat < 0:
-        lat_prefix = "s"
-    else:
-        lat_prefix = "n"
-    if lon < 0:
-        lon_prefix = "w"
-    else:
-        lon_prefix = "e"
-
-    return f"{lat_prefix}{abs(lat):02}{lon_prefix}{abs(lon):03}"
+    tiles = np.char.add(
+        np.char.add(lat_prefix, lat_digits), np.char.add(lon_prefix, lon_digits)
+    )
+    return tiles.tolist()
 
 
 def _build_download_link(tile: str, resolution=TileResolution.ONE_ARC_SECOND) -> str:
@@ -96,10 +106,13 @@ def _download_tile(
 
         destination.parent.mkdir(exist_ok=True)
 
-        # write to file in chunks
-        with destination.open("wb") as f:
-            for chunk in r.iter_content(chunk_size=8192):
-                f.write(chunk)
+        # stream the body to a temporary file in 1 MB chunks, then rename it
+        # into place so concurrent downloads never see a partial tile
+        part_file = destination.with_suffix(".part")
+        r.raw.decode_content = True
+        with part_file.open("wb") as f:
+            shutil.copyfileobj(r.raw, f, length=1024 * 1024)
+        os.replace(part_file, destination)
 
     return destination
 
@@ -151,10 +164,7 @@ def add_grade_to_graph(
         min_lon = node_gdf.x.min()
         max_lon = node_gdf.x.max()
 
-        lats = _cover_floats_with_integers(min_lat, max_lat)
-        lons = _cover_floats_with_integers(min_lon, max_lon)
-
-        tiles = map(_lat_lon_to_tile, itertools.product(lats, lons))
+        tiles = _tiles_covering_bounds(min_lat, max_lat, min_lon, max_lon)
 
         if isinstance(resolution_arc_seconds, int):
             resolution = TileResolution.from_int(resolution_arc_seconds)
@@ -166,12 +176,11 @@ def add_grade_to_graph(
                 "Must be one of: int, str"
             )
 
-        files = []
-        for tile in tiles:
-            downloaded_file = _download_tile(
-                tile, output_dir=output_dir, resolution=resolution
-            )
-            files.append(str(downloaded_file))
+        # tiles are independent network-bound fetches, so download them
+        # concurrently; already-cached tiles are skipped inside _download_tile
+        download = partial(_download_tile, output_dir=output_dir, resolution=resolution)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            files = [str(f) for f in executor.map(download, tiles)]
 
         g = ox.add_node_elevations_raster(g, files)
     else: